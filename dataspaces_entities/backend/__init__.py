@@ -9,6 +9,7 @@ Currently implemented backends:
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if sys.version_info >= (3, 11):
@@ -60,7 +61,12 @@ def get_backend(
     backend: Backends | str | None = None,
     settings: dict[str, Any] | None = None,
 ) -> Backend:
-    """Get a backend instance."""
+    """Get a backend instance.
+
+    If no custom settings are given, a shared (cached) backend instance is returned.
+    This avoids validating the backend settings and instantiating the backend for
+    each request.
+    """
     # Import `get_config` here to avoid circular imports
     from dataspaces_entities.config import get_config
 
@@ -75,6 +81,27 @@ def get_backend(
             + "\n".join(f" - {_}" for _ in Backends.__members__.values())
         ) from exc
 
+    if settings is None:
+        backend_instance = _get_cached_backend(backend)
+
+        if not backend_instance.is_closed:
+            return backend_instance
+
+        # The shared backend instance has been closed - create a new one
+        _get_cached_backend.cache_clear()
+        return _get_cached_backend(backend)
+
+    return _create_backend(backend, settings)
+
+
+@lru_cache
+def _get_cached_backend(backend: Backends) -> Backend:
+    """Get a shared backend instance with the default settings."""
+    return _create_backend(backend)
+
+
+def _create_backend(backend: Backends, settings: dict[str, Any] | None = None) -> Backend:
+    """Create a new backend instance."""
     backend_class = backend.get_class()
 
     backend_settings = backend.get_default_settings()
@@ -7,9 +7,10 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, ValidationError
-from s7 import SOFT7Entity, get_entity
-from s7.exceptions import S7EntityError
+from pydantic import BaseModel
+from s7 import SOFT7Entity
+
+from dataspaces_entities.utils import get_identity
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Generator, Iterator
@@ -77,10 +78,10 @@ class Backend(ABC):
     # Container protocol methods
     def __contains__(self, item: Any) -> bool:
         if isinstance(item, dict):
-            # Convert to SOFT7 Entity
+            # Only retrieve the identity, there is no need to validate the whole entity
             try:
-                item = get_entity(item)
-            except (ValidationError, S7EntityError) as error:
+                item = get_identity(item)
+            except (ValueError, TypeError) as error:
                 LOGGER.error(
                     "item given to __contains__ is malformed, not a SOFT7 entity.\nItem: %r\nError: %s",
                     item,
@@ -90,11 +91,11 @@ class Backend(ABC):
 
         if isinstance(item, str):
             # Expect it to be a TEAM4.0-style URL - let the backend handle validation
-            return self.read(item) is not None
+            return self.has_identity(item)
 
         if isinstance(item, SOFT7Entity):
             # NOTE: We currently expect all identities to be TEAM4.0-style URLs
-            return self.read(item.identity) is not None
+            return self.has_identity(str(item.identity))
 
         return False
 
@@ -116,8 +117,11 @@ class Backend(ABC):
     @abstractmethod
     def create(
         self, entities: Iterable[SOFT7Entity | dict[str, Any]]
-    ) -> list[dict[str, Any]] | dict[str, Any] | None:  # pragma: no cover
-        """Create an entity in the backend."""
+    ) -> list[dict[str, Any]]:  # pragma: no cover
+        """Create one or more entities in the backend.
+
+        Always return a list of the created entities, also for a single entity.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -134,11 +138,38 @@ class Backend(ABC):
         """Update an entity in the backend."""
         raise NotImplementedError
 
+    def update_many(
+        self,
+        entities: Iterable[tuple[AnyHttpUrl | str, SOFT7Entity | dict[str, Any]]],
+    ) -> None:
+        """Update several entities in the backend.
+
+        The entities are given as pairs of an entity identity and the (partial) entity to update it with.
+
+        Backends should override this to update all entities in a single operation.
+        """
+        for entity_identity, entity in entities:
+            self.update(entity_identity, entity)
+
     @abstractmethod
     def delete(self, entity_identities: Iterable[AnyHttpUrl | str]) -> None:  # pragma: no cover
         """Delete one or more entities in the backend."""
         raise NotImplementedError
 
+    def has_identity(self, entity_identity: AnyHttpUrl | str) -> bool:
+        """Return whether an entity with the given identity exists in the backend.
+
+        Backends should override this to avoid retrieving the whole entity.
+        """
+        return self.read(entity_identity) is not None
+
+    def exists_many(self, entity_identities: Iterable[AnyHttpUrl | str]) -> set[str]:
+        """Return the subset of the given entity identities that exist in the backend.
+
+        Backends should override this to check all identities in a single query.
+        """
+        return {str(identity) for identity in entity_identities if str(identity) in self}
+
     # Backend methods (search)
     @abstractmethod
     def search(
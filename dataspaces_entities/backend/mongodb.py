@@ -7,6 +7,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Annotated, Literal
 
 from pydantic import Field, SecretStr
+from pymongo import UpdateOne
 from pymongo.errors import (
     BulkWriteError,
     InvalidDocument,
@@ -45,6 +46,10 @@ BACKEND_DRIVER_MAPPING: dict[Backends, Literal["pymongo"]] = {
 }
 
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+"""MongoDB server error code for a violated unique index."""
+
+
 # Exceptions
 class MongoDBBackendError(BackendError, PyMongoError, InvalidDocument):
     """Any MongoDB backend error exception."""
@@ -105,10 +110,27 @@ def get_client(
 
     LOGGER.debug("Creating new MongoDB client.")
 
+    # Only override PyMongo's defaults if explicitly configured
+    options: dict[str, Any] = {}
+    if config.mongo_wait_queue_timeout_ms is not None:
+        options["waitQueueTimeoutMS"] = config.mongo_wait_queue_timeout_ms
+    if config.mongo_server_selection_timeout_ms is not None:
+        options["serverSelectionTimeoutMS"] = config.mongo_server_selection_timeout_ms
+    if config.mongo_compressors and (
+        compressors := [
+            compressor.strip() for compressor in config.mongo_compressors.split(",") if compressor.strip()
+        ]
+    ):
+        options["compressors"] = compressors
+
     return MongoClient(
         uri or str(config.mongo_uri),
         username=config.mongo_user,
         password=config.mongo_password.get_secret_value(),
+        maxPoolSize=config.mongo_max_pool_size,
+        minPoolSize=config.mongo_min_pool_size,
+        maxIdleTimeMS=config.mongo_max_idle_time_ms,
+        **options,
     )
 
 
@@ -168,22 +190,34 @@ class MongoDBBackend(Backend):
         # Create a unique index for the IDENTITY
         self._collection.create_index(["identity"], unique=True, name="IDENTITY")
 
-    def create(
-        self, entities: Iterable[SOFT7Entity | dict[str, Any]]
-    ) -> list[dict[str, Any]] | dict[str, Any] | None:
+    def create(self, entities: Iterable[SOFT7Entity | dict[str, Any]]) -> list[dict[str, Any]]:
         """Create one or more entities in the MongoDB."""
         LOGGER.info("Creating entities: %s", entities)
         LOGGER.info("The creator's user name: %s", self._settings.mongo_username)
 
         entities = [self._prepare_entity(entity) for entity in entities]
 
-        result = self._collection.insert_many(entities)
-        if len(result.inserted_ids) > 1:
-            return list(
-                self._collection.find({"_id": {"$in": result.inserted_ids}}, projection={"_id": False})
+        # Rely on the unique IDENTITY index to detect already existing entities,
+        # instead of checking for their existence prior to inserting them
+        try:
+            result = self._collection.insert_many(
+                entities,
+                ordered=False,
+                comment="creating via the DS Entities Service MongoDB backend create() method",
             )
-
-        return self._collection.find_one({"_id": result.inserted_ids[0]}, projection={"_id": False})
+        except BulkWriteError as exc:
+            duplicate_identities = [
+                entities[error["index"]]["identity"]
+                for error in exc.details.get("writeErrors", [])
+                if error.get("code") == DUPLICATE_KEY_ERROR_CODE
+            ]
+            if duplicate_identities:
+                raise MongoDBBackendError(
+                    f"Entities already exist: identities=[{', '.join(duplicate_identities)}]"
+                ) from exc
+            raise
+
+        return list(self._collection.find({"_id": {"$in": result.inserted_ids}}, projection={"_id": False}))
 
     def read(self, entity_identity: AnyHttpUrl | str) -> dict[str, Any] | None:
         """Read an entity from the MongoDB."""
@@ -200,6 +234,39 @@ class MongoDBBackend(Backend):
         filter = self._single_identity_query(str(entity_identity))
         self._collection.update_one(filter, {"$set": entity})
 
+    def update_many(
+        self,
+        entities: Iterable[tuple[AnyHttpUrl | str, SOFT7Entity | dict[str, Any]]],
+    ) -> None:
+        """Update several entities in the MongoDB using a single bulk write."""
+        identities: list[str] = []
+        operations: list[UpdateOne] = []
+
+        for entity_identity, entity in entities:
+            identities.append(str(entity_identity))
+            operations.append(
+                UpdateOne(
+                    self._single_identity_query(str(entity_identity)),
+                    {"$set": self._prepare_entity(entity)},
+                )
+            )
+
+        if not operations:
+            return
+
+        try:
+            self._collection.bulk_write(
+                operations,
+                ordered=False,
+                comment="updating via the DS Entities Service MongoDB backend update_many() method",
+            )
+        except BulkWriteError as exc:
+            LOGGER.error(
+                "Could not update entities: identities=[%s]",
+                ", ".join(identities[error["index"]] for error in exc.details.get("writeErrors", [])),
+            )
+            raise
+
     def delete(self, entity_identities: Iterable[AnyHttpUrl | str]) -> None:
         """Delete one or more entities in the MongoDB."""
         for identity in entity_identities:
@@ -213,6 +280,23 @@ class MongoDBBackend(Backend):
             comment="deleting via the DS Entities Service MongoDB backend delete() method",
         )
 
+    def has_identity(self, entity_identity: AnyHttpUrl | str) -> bool:
+        """Return whether an entity with the given identity exists in the MongoDB."""
+        filter = self._single_identity_query(str(entity_identity))
+        return self._collection.find_one(filter, projection={"_id": True}) is not None
+
+    def exists_many(self, entity_identities: Iterable[AnyHttpUrl | str]) -> set[str]:
+        """Return the subset of the given entity identities that exist in the MongoDB.
+
+        All identities are checked using a single query.
+        """
+        cursor = self._collection.find(
+            {"identity": {"$in": [str(identity) for identity in entity_identities]}},
+            projection={"_id": False, "identity": True},
+            comment="existence check via the DS Entities Service MongoDB backend exists_many() method",
+        )
+        return {document["identity"] for document in cursor}
+
     def search(
         self,
         raw_query: Any = None,
@@ -232,18 +316,17 @@ class MongoDBBackend(Backend):
             raise MongoDBBackendError(f"Query must be a dict for {self.__class__.__name__}.")
 
         if not query:
-            if any((by_properties, by_dimensions, by_identity)):
-                query = {"$or": []}
+            conditions: list[dict[str, Any]] = []
 
             if by_properties:
-                query["$or"].extend(
+                conditions.extend(
                     [
                         {"properties": {"$in": by_properties}},
                         {"properties.name": {"$in": by_properties}},
                     ]
                 )
             if by_dimensions:
-                query["$or"].extend(
+                conditions.extend(
                     [
                         {"dimension": {"$in": by_dimensions}},
                         {"dimension.name": {"$in": by_dimensions}},
@@ -254,11 +337,14 @@ class MongoDBBackend(Backend):
                     if URI_REGEX.match(str(identity)) is None:
                         raise ValueError(f"Invalid entity identity: {identity}")
 
-                query["$or"].extend(
-                    [
-                        {"identity": {"$in": [str(identity) for identity in by_identity]}},
-                    ]
-                )
+                conditions.append({"identity": {"$in": [str(identity) for identity in by_identity]}})
+
+            # Avoid an $or query for a single condition, e.g., when only searching by identity,
+            # letting MongoDB plan a single index lookup
+            if len(conditions) == 1:
+                query = conditions[0]
+            elif conditions:
+                query = {"$or": conditions}
 
         cursor = self._collection.find(
             query,
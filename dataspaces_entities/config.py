@@ -5,7 +5,7 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Annotated
 
-from pydantic import Field, SecretStr
+from pydantic import Field, SecretStr, model_validator
 from pydantic.networks import UrlConstraints
 from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -62,6 +62,85 @@ class ServiceConfig(BaseSettings):
         ),
     ] = "entities"
 
+    mongo_max_pool_size: Annotated[
+        int,
+        Field(
+            description=(
+                "Maximum number of concurrent connections to the MongoDB per service worker. "
+                "Should match the number of concurrently handled requests per worker. "
+                "Set to 0 for no limit."
+            ),
+            ge=0,
+        ),
+    ] = 100
+
+    mongo_min_pool_size: Annotated[
+        int,
+        Field(
+            description="Minimum number of connections to the MongoDB kept open per service worker.",
+            ge=0,
+        ),
+    ] = 0
+
+    mongo_max_idle_time_ms: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Maximum number of milliseconds a connection to the MongoDB may remain idle before "
+                "being closed. If not set, idle connections are never closed."
+            ),
+            gt=0,
+        ),
+    ] = 60_000
+
+    mongo_wait_queue_timeout_ms: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Opt-in maximum number of milliseconds to wait for a free connection to the MongoDB "
+                "when the connection pool is exhausted. If not set, PyMongo's default is used "
+                "(wait indefinitely)."
+            ),
+            gt=0,
+        ),
+    ] = None
+
+    mongo_server_selection_timeout_ms: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Opt-in maximum number of milliseconds to wait for an available MongoDB server. "
+                "If not set, PyMongo's default is used (30 seconds)."
+            ),
+            gt=0,
+        ),
+    ] = None
+
+    mongo_compressors: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Comma-separated list of wire protocol compressors to offer the MongoDB, in order of "
+                "preference. The first one also supported by the server is used. Set to an empty value "
+                "to disable compression."
+            ),
+        ),
+    ] = "zstd,zlib"
+
+    @model_validator(mode="after")
+    def _check_mongo_pool_sizes(self) -> ServiceConfig:
+        """Ensure the minimum MongoDB connection pool size does not exceed the maximum.
+
+        Note, a maximum pool size of 0 means no limit in PyMongo.
+        """
+        if self.mongo_max_pool_size and self.mongo_min_pool_size > self.mongo_max_pool_size:
+            raise ValueError(
+                f"mongo_min_pool_size ({self.mongo_min_pool_size}) must be smaller than or equal to "
+                f"mongo_max_pool_size ({self.mongo_max_pool_size})."
+            )
+
+        return self
+
 
 # The configuration is an LRU-cached function to avoid re-reading the environment variables.
 # This is done for both historical and performance reasons.
@@ -15,39 +15,48 @@ from dataspaces_entities.routers import get_routers
 
 LOGGER = logging.getLogger(__name__)
 
+DISABLE_AUTH_ROLE_CHECKS: bool = bool(int(os.getenv("DS_ENTITIES_DISABLE_AUTH_ROLE_CHECKS", "0")))
+"""Whether the service runs in test mode, i.e., without authentication and role checks.
+
+Read once at import, since the environment variable is not expected to change while the service runs.
+"""
+
 # Handle testing
-if bool(int(os.getenv("DS_ENTITIES_DISABLE_AUTH_ROLE_CHECKS", "0"))):
+if DISABLE_AUTH_ROLE_CHECKS:
     import dataspaces_auth.fastapi._auth as ds_auth
     from dataspaces_auth.fastapi._models import TokenData
 
     from dataspaces_entities.models import DSAPIRole
 
+    # The test token data never changes, so it is only created (and validated) once
+    TEST_TOKEN_DATA = TokenData(
+        # Role mapping
+        resource_access={
+            "backend": {
+                "roles": [
+                    DSAPIRole.ENTITIES_ADMIN,
+                    DSAPIRole.ENTITIES_DELETE,
+                    DSAPIRole.ENTITIES_READ,
+                    DSAPIRole.ENTITIES_WRITE,
+                    DSAPIRole.ENTITIES_EDIT,
+                ]
+            },
+            # Required resource_access field (for the model)
+            "account": {"roles": []},
+        },
+        # Required fields (for the model)
+        preferred_username="test_user",
+        iss="https://semanticmatter.com",
+        exp=1234567890,
+        aud=["test_client"],
+        sub="test_user",
+        iat=1234567890,
+        jti="test_jti",
+    )
+
     # Override DataSpaces-Auth valid_access_token dependency
     async def disable_auth_valid_access_token() -> TokenData:
-        return TokenData(
-            # Role mapping
-            resource_access={
-                "backend": {
-                    "roles": [
-                        DSAPIRole.ENTITIES_ADMIN,
-                        DSAPIRole.ENTITIES_DELETE,
-                        DSAPIRole.ENTITIES_READ,
-                        DSAPIRole.ENTITIES_WRITE,
-                        DSAPIRole.ENTITIES_EDIT,
-                    ]
-                },
-                # Required resource_access field (for the model)
-                "account": {"roles": []},
-            },
-            # Required fields (for the model)
-            preferred_username="test_user",
-            iss="https://semanticmatter.com",
-            exp=1234567890,
-            aud=["test_client"],
-            sub="test_user",
-            iat=1234567890,
-            jti="test_jti",
-        )
+        return TEST_TOKEN_DATA
 
     ds_auth.valid_access_token = disable_auth_valid_access_token
 
@@ -63,7 +72,7 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
     # Initialize backend
     get_backend(config.backend).initialize()
 
-    if bool(int(os.getenv("DS_ENTITIES_DISABLE_AUTH_ROLE_CHECKS", "0"))):
+    if DISABLE_AUTH_ROLE_CHECKS:
         LOGGER.debug(
             "Running in test mode.\n"
             "    - External OAuth2 authentication is disabled!\n"
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+import orjson
 import yaml
 from fastapi import Request, Response
 from fastapi.datastructures import Default
@@ -14,6 +15,12 @@ from fastapi.utils import generate_unique_id
 from pydantic import ValidationError
 from s7 import get_entity
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    # PyYAML was built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable, Coroutine, Sequence
     from enum import Enum
@@ -32,11 +39,24 @@ LOGGER = logging.getLogger(__name__)
 class YamlRequest(Request):
     """Custom request class for SOFT Entities requests supporting both JSON and YAML bodies."""
 
+    async def json(self) -> Any:
+        """Parse and return the request body as JSON.
+
+        Overrides Starlette's implementation to parse the body using orjson.
+        Note, `orjson.JSONDecodeError` is a sub-class of `json.JSONDecodeError`.
+        """
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            self._json = orjson.loads(body)
+
+        return self._json
+
     async def yaml(self) -> list[Any]:
         """Parse and return the request body as YAML."""
         if not hasattr(self, "_yaml"):
             body = await self.body()
-            self._yaml = list(yaml.safe_load_all(body))
+            # Use the C-based libyaml loader, if available
+            self._yaml = list(yaml.load_all(body, Loader=YamlLoader))
 
         return self._yaml
 
@@ -0,0 +1,26 @@
+"""Custom FastAPI/Starlette Responses."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import orjson
+from fastapi.responses import JSONResponse
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson.
+
+    Meant for content that is already JSON-compatible, e.g., entities retrieved from the backend,
+    which can then bypass FastAPI's response model validation and serialization.
+
+    Note, FastAPI's own `ORJSONResponse` is deprecated in newer versions, since FastAPI serializes
+    directly via pydantic when a response model is set. Setting a custom response class for a route
+    with a response model disables this, so only use this class for routes without a response model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Generator
-
     from fastapi import APIRouter
 
 
-def get_routers() -> Generator[APIRouter]:
-    """Get the routers."""
+@lru_cache(maxsize=1)
+def get_routers() -> tuple[APIRouter, ...]:
+    """Get the routers.
+
+    The routers are module-level singletons, so they are only discovered once.
+    """
     this_dir = Path(__file__).resolve().parent
 
+    routers: list[APIRouter] = []
+
     for path in this_dir.glob("*.py"):
         if path.stem == "__init__":
             continue
@@ -25,4 +30,6 @@ def get_routers() -> Generator[APIRouter]:
         if not hasattr(module, "ROUTER"):
             raise RuntimeError(f"Module {module.__name__} has no ROUTER")
 
-        yield module.ROUTER
+        routers.append(module.ROUTER)
+
+    return tuple(routers)
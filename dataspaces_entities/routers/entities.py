@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Annotated, Any
+from itertools import chain
+from typing import TYPE_CHECKING, Annotated, Any
 
+import orjson
 from dataspaces_auth.fastapi import has_role
 from fastapi import (
     APIRouter,
@@ -15,16 +17,21 @@ from fastapi import (
     Response,
     status,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
-from pydantic import Field, ValidationError, conlist
+from fastapi.responses import StreamingResponse
+from pydantic import Field, ValidationError
 from s7 import SOFT7Entity
 
 from dataspaces_entities.backend import get_backend
-from dataspaces_entities.config import get_config
 from dataspaces_entities.models import URI_REGEX, DSAPIRole, HTTPError
 from dataspaces_entities.requests import YamlRequest, YamlRoute
+from dataspaces_entities.responses import ORJSONResponse
 from dataspaces_entities.utils import get_identity
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Collection, Iterable, Iterator
+
 LOGGER = logging.getLogger(__name__)
 
 ROUTER = APIRouter(
@@ -34,20 +41,74 @@ ROUTER = APIRouter(
 )
 
 URIStrictType = Annotated[str, Field(pattern=URI_REGEX.pattern)]
-EmptyList: type[list[Any]] = conlist(Any, min_length=0, max_length=0)  # type: ignore[arg-type]
+
+EMPTY_LIST_CONTENT: dict[str, Any] = {
+    "application/json": {
+        "schema": {"type": "array", "items": {}, "maxItems": 0, "title": "Empty List"},
+        "example": [],
+    },
+}
+"""OpenAPI response content for an empty list.
+
+Defined statically to avoid building a pydantic schema only for the OpenAPI specification.
+"""
+
+WRITE_ERROR_DETAIL = "Could not {operation} entit{suffix} with identit{suffix}: {identities}"
+"""Template for the detail of a 502 Bad Gateway HTTP error raised on write failures."""
+
+EMPTY_LIST_JSON = b"[]"
+"""Pre-serialized JSON body for responses with no Entities."""
+
+
+def write_error(operation: str, identities: Collection[str]) -> HTTPException:
+    """Return a 502 Bad Gateway HTTP error for a failed write operation.
+
+    Only call this on failure, since joining the identities is linear in their number.
+    """
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail=WRITE_ERROR_DETAIL.format(
+            operation=operation,
+            suffix="y" if len(identities) == 1 else "ies",
+            identities=", ".join(identities),
+        ),
+    )
+
+
+def empty_list_response() -> Response:
+    """Return a 200 response with an empty JSON list, bypassing response model validation."""
+    return Response(content=EMPTY_LIST_JSON, status_code=status.HTTP_200_OK, media_type="application/json")
+
+
+def no_content_response() -> Response:
+    """Return a body-less 204 response, bypassing response model validation and serialization."""
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def iter_entities_json(entities: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Serialize Entities as a JSON list, one Entity at a time."""
+    separator = b"["
+    for entity in entities:
+        yield separator + orjson.dumps(entity, option=orjson.OPT_NON_STR_KEYS)
+        separator = b","
+
+    yield EMPTY_LIST_JSON if separator == b"[" else b"]"
 
 
 @ROUTER.get(
     "/",
-    response_model=list[SOFT7Entity] | SOFT7Entity,
-    response_model_by_alias=True,
-    response_model_exclude_unset=True,
+    # The response model is only used for the OpenAPI specification.
+    # The Entities are validated when written to the backend, so they are not re-validated when retrieved.
+    response_model=None,
     dependencies=[Depends(has_role(DSAPIRole.ENTITIES_READ))],
     summary="Retrieve one or more Entity.",
     response_description="Retrieved Entity or Entities.",
-    responses={404: {"description": "Entites not found", "model": HTTPError}},
+    responses={
+        200: {"model": list[SOFT7Entity] | SOFT7Entity},
+        404: {"description": "Entites not found", "model": HTTPError},
+    },
 )
-async def get_entities(
+def get_entities(
     identities: Annotated[
         list[URIStrictType] | None,
         Query(
@@ -74,34 +135,47 @@ async def get_entities(
             alias="dim",
         ),
     ] = None,
-) -> list[dict[str, Any]] | dict[str, Any]:
+) -> ORJSONResponse | StreamingResponse:
     """Retrieve one or more Entities.
 
     An inclusive search will be performed based the provided identities, properties,
     and dimensions. If no search parameters are provided, all entities will be
     retrieved.
+
+    Note, this is a regular function, since the backend is synchronous.
+    FastAPI will run it in a threadpool, not blocking the event loop.
     """
     backend = get_backend()
 
-    entities = list(
+    entities = iter(
         backend.search(by_identity=identities, by_properties=properties, by_dimensions=dimensions)
     )
 
-    if entities:
-        if len(entities) == 1:
-            return entities[0]
-        return entities
+    # Only retrieve the first two entities to determine whether to return a single entity or a list.
+    # A list is streamed, avoiding holding all retrieved entities in memory at once.
+    if (first_entity := next(entities, None)) is not None:
+        if (second_entity := next(entities, None)) is None:
+            return ORJSONResponse(first_entity)
 
-    LOGGER.error(
-        "Could not find entities:\n  identities=%s\n  properties=%s\n  dimensions=%s",
-        ", ".join(identities) if identities else "None",
-        ", ".join(properties) if properties else "None",
-        ", ".join(dimensions) if dimensions else "None",
-    )
+        return StreamingResponse(
+            iter_entities_json(chain((first_entity, second_entity), entities)),
+            media_type="application/json",
+        )
+
+    # Avoid joining the search parameters if the message will not be emitted
+    if LOGGER.isEnabledFor(logging.ERROR):
+        LOGGER.error(
+            "Could not find entities:\n  identities=%s\n  properties=%s\n  dimensions=%s",
+            ", ".join(identities) if identities else "None",
+            ", ".join(properties) if properties else "None",
+            ", ".join(dimensions) if dimensions else "None",
+        )
 
-    raise HTTPException(
+    # Return the error response directly instead of raising an HTTPException for the exception handler.
+    # The content is equivalent to the one created by FastAPI's HTTPException handler.
+    return ORJSONResponse(
+        {"detail": f"Could not find entities: identities={identities}"},
         status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Could not find entities: identities={identities}",
     )
 
 
@@ -115,14 +189,14 @@ async def get_entities(
     summary="Create one or more Entities.",
     response_description="Created Entity or Entities.",
     responses={
-        200: {"description": "There are no Entities to replace or create", "model": EmptyList},
+        200: {
+            "description": "There are no Entities to replace or create",
+            "content": EMPTY_LIST_CONTENT,
+        },
         502: {"description": "Internal write error", "model": HTTPError},
     },
 )
-async def create_entities(
-    request: YamlRequest,
-    response: Response,
-) -> list[dict[str, Any]] | dict[str, Any]:
+async def create_entities(request: YamlRequest) -> list[dict[str, Any]] | dict[str, Any] | Response:
     """Create one or more Entities."""
     # Parse entities from request
     try:
@@ -143,42 +217,25 @@ async def create_entities(
     if isinstance(entities, list):
         # Check if there are any entities to create
         if not entities:
-            response.status_code = status.HTTP_200_OK
-            return []
+            return empty_list_response()
     else:
         entities = [entities]
 
-    write_fail_exception = HTTPException(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail=(
-            "Could not create entit"
-            "{suffix} with identit{suffix}: {identities}".format(
-                suffix="y" if len(entities) == 1 else "ies",
-                identities=", ".join(get_identity(entity) for entity in entities),
-            )
-        ),
-    )
+    identities = [get_identity(entity) for entity in entities]
 
-    entities_backend = get_backend(get_config().backend)
+    entities_backend = get_backend()
 
     try:
-        created_entities = entities_backend.create(entities)
+        created_entities = await run_in_threadpool(entities_backend.create, entities)
     except entities_backend.write_access_exception as err:
-        LOGGER.error(
-            "Could not create entities: identities=[%s]",
-            ", ".join(get_identity(entity) for entity in entities),
-        )
+        LOGGER.error("Could not create entities: identities=[%s]", ", ".join(identities))
         LOGGER.exception(err)
-        raise write_fail_exception from err
+        raise write_error("create", identities) from err
 
-    if (
-        created_entities is None
-        or (len(entities) == 1 and isinstance(created_entities, list))
-        or (len(entities) > 1 and not isinstance(created_entities, list))
-    ):
-        raise write_fail_exception
+    if len(created_entities) != len(entities):
+        raise write_error("create", identities)
 
-    return created_entities
+    return created_entities[0] if len(created_entities) == 1 else created_entities
 
 
 @ROUTER.put(
@@ -191,15 +248,15 @@ async def create_entities(
     summary="Replace and/or create one or more Entities.",
     response_description="Created (not replaced) Entity or Entities.",
     responses={
-        200: {"description": "There are no Entities to replace or create", "model": EmptyList},
+        200: {
+            "description": "There are no Entities to replace or create",
+            "content": EMPTY_LIST_CONTENT,
+        },
         204: {"description": "Replaced (not created) Entity or Entitites"},
         502: {"description": "Internal write error", "model": HTTPError},
     },
 )
-async def update_entities(
-    request: YamlRequest,
-    response: Response,
-) -> list[dict[str, Any]] | dict[str, Any] | None:
+async def update_entities(request: YamlRequest) -> list[dict[str, Any]] | dict[str, Any] | Response:
     """Replace and/or create one or more Entities."""
     # Parse entities from request
     try:
@@ -220,66 +277,56 @@ async def update_entities(
     if isinstance(entities, list):
         # Check if there are any entities to update
         if not entities:
-            response.status_code = status.HTTP_200_OK
-            return []
+            return empty_list_response()
     else:
         entities = [entities]
 
-    write_fail_exception = HTTPException(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail=(
-            "Could not put/update entit"
-            "{suffix} with identit{suffix}: {identities}".format(
-                suffix="y" if len(entities) == 1 else "ies",
-                identities=", ".join(get_identity(entity) for entity in entities),
-            )
-        ),
-    )
+    identities = [get_identity(entity) for entity in entities]
 
-    entities_backend = get_backend(get_config().backend)
+    entities_backend = get_backend()
 
-    new_entities = [entity for entity in entities if get_identity(entity) not in entities_backend]
+    existing_identities = await run_in_threadpool(entities_backend.exists_many, identities)
+
+    # Split the entities into new and existing entities using the hashed identities,
+    # avoiding any (expensive) equality comparisons between the entities themselves
+    new_entities: list[SOFT7Entity] = []
+    existing_entities: list[tuple[str, SOFT7Entity]] = []
+    for entity, identity in zip(entities, identities, strict=True):
+        if identity in existing_identities:
+            existing_entities.append((identity, entity))
+        else:
+            new_entities.append(entity)
 
     if new_entities:
         try:
-            created_entities = entities_backend.create(new_entities)
+            created_entities = await run_in_threadpool(entities_backend.create, new_entities)
         except entities_backend.write_access_exception as err:
             LOGGER.error(
                 "Could not create entities: identities=[%s]",
-                ", ".join(get_identity(entity) for entity in new_entities),
+                ", ".join(identity for identity in identities if identity not in existing_identities),
             )
             LOGGER.exception(err)
-            raise write_fail_exception from err
+            raise write_error("put/update", identities) from err
 
-        if (
-            created_entities is None
-            or (len(new_entities) == 1 and isinstance(created_entities, list))
-            or (len(new_entities) > 1 and not isinstance(created_entities, list))
-        ):
-            raise write_fail_exception
+        if len(created_entities) != len(new_entities):
+            raise write_error("put/update", identities)
 
     # Update existing entities
-    for entity in entities:
-        if entity in new_entities:
-            continue
-
-        if (identity := get_identity(entity)) in entities_backend:
-            try:
-                entities_backend.update(identity, entity)
-            except entities_backend.write_access_exception as err:
-                LOGGER.error(
-                    "Could not update entities: identities=[%s]",
-                    ", ".join(get_identity(entity) for entity in entities),
-                )
-                LOGGER.error("Error happened when updating entity: identity=%s", identity)
-                LOGGER.exception(err)
-                raise write_fail_exception from err
+    if existing_entities:
+        try:
+            await run_in_threadpool(entities_backend.update_many, existing_entities)
+        except entities_backend.write_access_exception as err:
+            LOGGER.error(
+                "Could not update entities: identities=[%s]",
+                ", ".join(identity for identity, _ in existing_entities),
+            )
+            LOGGER.exception(err)
+            raise write_error("put/update", identities) from err
 
     if new_entities:
-        return created_entities
+        return created_entities[0] if len(created_entities) == 1 else created_entities
 
-    response.status_code = status.HTTP_204_NO_CONTENT
-    return None
+    return no_content_response()
 
 
 @ROUTER.patch(
@@ -292,11 +339,14 @@ async def update_entities(
     summary="Update one or more Entities.",
     response_description="Updated Entity or Entities.",
     responses={
-        200: {"description": "There are no Entities to update", "model": EmptyList},
+        200: {
+            "description": "There are no Entities to update",
+            "content": EMPTY_LIST_CONTENT,
+        },
         502: {"description": "Internal write error", "model": HTTPError},
     },
 )
-async def patch_entities(request: YamlRequest, response: Response) -> list[Any] | None:
+async def patch_entities(request: YamlRequest) -> Response:
     """Update one or more Entities."""
     # Parse entities from request
     try:
@@ -313,46 +363,32 @@ async def patch_entities(request: YamlRequest, response: Response) -> list[Any]
     if isinstance(entities, list):
         # Check if there are any entities to update
         if not entities:
-            response.status_code = status.HTTP_200_OK
-            return []
+            return empty_list_response()
     else:
         entities = [entities]
 
-    write_fail_exception = HTTPException(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail=(
-            "Could not patch/update entit"
-            "{suffix} with identit{suffix}: {identities}".format(
-                suffix="y" if len(entities) == 1 else "ies",
-                identities=", ".join(get_identity(entity) for entity in entities),
-            )
-        ),
-    )
+    identities = [get_identity(entity) for entity in entities]
 
-    entities_backend = get_backend(get_config().backend)
+    entities_backend = get_backend()
 
     # First, check all entities already exist
-    non_existing_entities = [entity for entity in entities if get_identity(entity) not in entities_backend]
-    if non_existing_entities:
+    existing_identities = await run_in_threadpool(entities_backend.exists_many, identities)
+    non_existing_identities = [identity for identity in identities if identity not in existing_identities]
+    if non_existing_identities:
         LOGGER.error(
             "Cannot patch non-existent entities: identities=[%s]",
-            ", ".join(get_identity(entity) for entity in non_existing_entities),
+            ", ".join(non_existing_identities),
         )
-        raise write_fail_exception
+        raise write_error("patch/update", identities)
 
-    for entity in entities:
-        try:
-            entities_backend.update(get_identity(entity), entity)
-        except entities_backend.write_access_exception as err:
-            LOGGER.error(
-                "Could not update entities: identities=[%s]",
-                ", ".join(get_identity(entity) for entity in entities),
-            )
-            LOGGER.error("Error happened when updating entity: identity=%s", get_identity(entity))
-            LOGGER.exception(err)
-            raise write_fail_exception from err
+    try:
+        await run_in_threadpool(entities_backend.update_many, list(zip(identities, entities, strict=True)))
+    except entities_backend.write_access_exception as err:
+        LOGGER.error("Could not update entities: identities=[%s]", ", ".join(identities))
+        LOGGER.exception(err)
+        raise write_error("patch/update", identities) from err
 
-    return None
+    return no_content_response()
 
 
 @ROUTER.delete(
@@ -367,7 +403,7 @@ async def patch_entities(request: YamlRequest, response: Response) -> list[Any]
         502: {"description": "Internal write error", "model": HTTPError},
     },
 )
-async def delete_entities(
+def delete_entities(
     identities_body: Annotated[
         list[URIStrictType] | URIStrictType | None,
         Body(
@@ -384,16 +420,27 @@ async def delete_entities(
         ),
     ] = None,
 ) -> list[URIStrictType] | URIStrictType:
-    """Delete one or more Entities."""
-    identities: set[URIStrictType] = set()
+    """Delete one or more Entities.
+
+    Note, this is a regular function, since the backend is synchronous.
+    FastAPI will run it in a threadpool, not blocking the event loop.
+    """
+    identities: dict[URIStrictType, None] | tuple[URIStrictType]
 
-    if isinstance(identities_body, str):
-        identities.add(identities_body)
-    elif isinstance(identities_body, list):
-        identities.update(identities_body)
+    if identities_query is None and isinstance(identities_body, str):
+        # Fast path for the common case of a single identity given in the body
+        identities = (identities_body,)
+    else:
+        # Use dict keys to remove duplicates while preserving the order of the request
+        identities = {}
+
+        if isinstance(identities_body, str):
+            identities[identities_body] = None
+        elif isinstance(identities_body, list):
+            identities.update(dict.fromkeys(identities_body))
 
-    if isinstance(identities_query, list):
-        identities.update(identities_query)
+        if isinstance(identities_query, list):
+            identities.update(dict.fromkeys(identities_query))
 
     if not identities:
         raise HTTPException(
@@ -401,7 +448,7 @@ async def delete_entities(
             detail="No Entity identities provided.",
         )
 
-    entities_backend = get_backend(get_config().backend)
+    entities_backend = get_backend()
 
     try:
         entities_backend.delete(identities)
@@ -411,18 +458,9 @@ async def delete_entities(
             ", ".join(str(identity) for identity in identities),
         )
         LOGGER.exception(err)
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=(
-                "Could not delete entit"
-                "{suffix} with identit{suffix}: {identities}".format(
-                    suffix="y" if len(identities) == 1 else "ies",
-                    identities=", ".join(str(identity) for identity in identities),
-                )
-            ),
-        ) from err
+        raise write_error("delete", identities) from err
 
     if len(identities) == 1:
-        return identities.pop()
+        return next(iter(identities))
 
-    return sorted(identities)
+    return list(identities)
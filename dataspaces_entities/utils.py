@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 from s7 import SOFT7Entity
@@ -11,24 +12,27 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 def get_identity(entity: SOFT7Entity | dict[str, Any]) -> str:
-    """Get the identity of an entity."""
-    if isinstance(entity, SOFT7Entity):
-        return str(entity.identity)
+    """Get the identity of an entity.
 
+    The identity is interned, as it is used repeatedly for set membership and as dict key.
+    """
+    # Check for dictionaries first, as they are the most common input and the
+    # instance check is cheaper than for the SOFT7Entity pydantic model
     if not isinstance(entity, dict):
+        if isinstance(entity, SOFT7Entity):
+            return sys.intern(str(entity.identity))
+
         raise TypeError("entity must be a SOFT7Entity or a dictionary.")
 
-    if "uri" in entity:
-        return entity["uri"]
+    if identity := entity.get("uri") or entity.get("identity"):
+        # Only strings can be interned, e.g., an AnyUrl identity is returned as-is
+        return sys.intern(identity) if isinstance(identity, str) else identity
 
-    if "identity" in entity:
-        return entity["identity"]
+    namespace, version, name = entity.get("namespace"), entity.get("version"), entity.get("name")
 
-    if not all(
-        (key in entity and isinstance(entity[key], str)) for key in ("namespace", "version", "name")
-    ):
-        raise ValueError(
-            "Entity must have either an identity/URI or all of 'namespace', 'version', and 'name' defined."
-        )
+    if isinstance(namespace, str) and isinstance(version, str) and isinstance(name, str):
+        return sys.intern(f"{namespace.rstrip('/')}/{version}/{name}")
 
-    return f"{entity['namespace'].rstrip('/')}/{entity['version']}/{entity['name']}"
+    raise ValueError(
+        "Entity must have either an identity/URI or all of 'namespace', 'version', and 'name' defined."
+    )
@@ -56,10 +56,10 @@ def test_create(parameterized_entity: ParameterizeGetEntities) -> None:
     backend = get_backend()
 
     # Create a single entity
-    entity_from_backend = backend.create([parameterized_entity.parsed_entity])
+    entities_from_backend = backend.create([parameterized_entity.parsed_entity])
 
-    assert isinstance(entity_from_backend, dict)
-    assert entity_from_backend == parameterized_entity.parsed_entity
+    assert isinstance(entities_from_backend, list)
+    assert entities_from_backend == [parameterized_entity.parsed_entity]
 
     # Create multiple entities
     raw_entities = [
@@ -93,6 +93,25 @@ def test_create(parameterized_entity: ParameterizeGetEntities) -> None:
     assert entities_from_backend[1] in raw_entities
 
 
+def test_create_existing(parameterized_entity: ParameterizeGetEntities) -> None:
+    """Test the create method raises for already existing entities."""
+    from dataspaces_entities.backend import get_backend
+    from dataspaces_entities.backend.mongodb import MongoDBBackendError
+
+    backend = get_backend()
+
+    new_entity = {
+        "identity": "http://onto-ns.com/meta/1.0/Test",
+        "properties": {"test": {"type": "string", "description": "test"}},
+    }
+
+    with pytest.raises(MongoDBBackendError, match=r"^Entities already exist: .*"):
+        backend.create([new_entity, parameterized_entity.parsed_entity])
+
+    # Entities that do not already exist are still created
+    assert backend.read(new_entity["identity"]) == new_entity
+
+
 def test_read(parameterized_entity: ParameterizeGetEntities) -> None:
     """Test the read method."""
     from dataspaces_entities.backend import get_backend
@@ -154,6 +173,34 @@ def test_update(parameterized_entity: ParameterizeGetEntities) -> None:
     assert entity_from_backend == changed_raw_entity
 
 
+def test_update_many(parameterized_entity: ParameterizeGetEntities) -> None:
+    """Test the update_many method."""
+    from copy import deepcopy
+
+    from dataspaces_entities.backend import get_backend
+
+    backend = get_backend()
+
+    # Change current entity
+    changed_raw_entity = deepcopy(parameterized_entity.parsed_entity)
+    changed_raw_entity["description"] = "Changed description."
+    assert changed_raw_entity != parameterized_entity.parsed_entity
+
+    # Apply the change
+    backend.update_many([(parameterized_entity.identity, changed_raw_entity)])
+
+    # Retrieve the entity again
+    entity_from_backend = backend._collection.find_one(
+        {"identity": parameterized_entity.identity}, projection={"_id": False}
+    )
+
+    assert isinstance(entity_from_backend, dict)
+    assert entity_from_backend == changed_raw_entity
+
+    # Updating nothing is a no-op
+    backend.update_many([])
+
+
 def test_delete(parameterized_entity: ParameterizeGetEntities) -> None:
     """Test the delete method."""
     from dataspaces_entities.backend import get_backend
@@ -196,6 +243,34 @@ def test_delete(parameterized_entity: ParameterizeGetEntities) -> None:
     assert len(backend) == number_of_entities - 1
 
 
+def test_has_identity(parameterized_entity: ParameterizeGetEntities) -> None:
+    """Test the has_identity method."""
+    from dataspaces_entities.backend import get_backend
+
+    backend = get_backend()
+
+    assert backend.has_identity(parameterized_entity.identity)
+    assert not backend.has_identity("http://onto-ns.com/meta/1.0/NonExistentEntity")
+
+    with pytest.raises(ValueError, match=r"^Invalid entity identity: .*"):
+        backend.has_identity("invalid_identity")
+
+
+def test_exists_many(parameterized_entity: ParameterizeGetEntities) -> None:
+    """Test the exists_many method."""
+    from dataspaces_entities.backend import get_backend
+
+    backend = get_backend()
+
+    non_existent_identity = "http://onto-ns.com/meta/1.0/NonExistentEntity"
+
+    assert backend.exists_many([parameterized_entity.identity, non_existent_identity]) == {
+        parameterized_entity.identity
+    }
+    assert backend.exists_many([non_existent_identity]) == set()
+    assert backend.exists_many([]) == set()
+
+
 def test_search(parameterized_entity: ParameterizeGetEntities) -> None:
     """Test the search method.
 
@@ -0,0 +1,54 @@
+"""Test creating the MongoDB client."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from typing import Any
+
+
+@pytest.fixture
+def client_kwargs(monkeypatch: pytest.MonkeyPatch) -> Generator[dict[str, Any]]:
+    """Capture the keyword arguments passed to `pymongo.MongoClient` by `get_client()`.
+
+    The configuration cache is cleared before and after the test, so the test can set
+    environment variables.
+    """
+    from dataspaces_entities.config import get_config
+
+    captured: dict[str, Any] = {}
+
+    def _mock_mongo_client(*args: Any, **kwargs: Any) -> None:  # noqa: ARG001
+        captured.update(kwargs)
+
+    monkeypatch.setattr("pymongo.MongoClient", _mock_mongo_client)
+
+    get_config.cache_clear()
+    yield captured
+    get_config.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("compressors", "expected"),
+    [("zstd, zlib", ["zstd", "zlib"]), ("zlib", ["zlib"]), ("", None), (" , ", None)],
+    ids=["spaced", "single", "disabled", "only-whitespace"],
+)
+def test_get_client_compressors(
+    client_kwargs: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+    compressors: str,
+    expected: list[str] | None,
+) -> None:
+    """Test the configured compressors are passed to the client, and only if any are set."""
+    from dataspaces_entities.backend.mongodb import get_client
+
+    monkeypatch.setenv("DS_ENTITIES_MONGO_COMPRESSORS", compressors)
+
+    # Bypass the LRU cache to always create a new client
+    get_client.__wrapped__()
+
+    assert client_kwargs.get("compressors") == expected, client_kwargs
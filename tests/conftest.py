@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, NamedTuple
 import pytest
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
     from typing import Any, Protocol
 
@@ -345,6 +346,20 @@ def backend_test_data(static_dir: Path) -> list[dict[str, Any]]:
     return yaml.safe_load((static_dir / "valid_entities_soft7.yaml").read_text())
 
 
+@pytest.fixture(autouse=True)
+def _clear_backend_cache() -> Generator[None]:
+    """Clear the cache of shared backend instances.
+
+    The backend class may be mocked for individual tests, so a shared backend
+    instance must never be reused between tests.
+    """
+    from dataspaces_entities.backend import _get_cached_backend
+
+    _get_cached_backend.cache_clear()
+    yield
+    _get_cached_backend.cache_clear()
+
+
 @pytest.fixture(autouse=True)
 def _reset_mongo_test_collection(
     backend_test_data: list[dict[str, Any]],
@@ -354,11 +369,14 @@ def _reset_mongo_test_collection(
     if not live_backend:
         return
 
+    from copy import deepcopy
+
     from dataspaces_entities.backend import get_backend
 
     backend: MongoDBBackend = get_backend()
     backend._collection.delete_many({})
-    backend._collection.insert_many(backend_test_data)
+    # Insert copies, since `insert_many()` adds an `_id` key to the inserted documents
+    backend._collection.insert_many(deepcopy(backend_test_data))
 
 
 @pytest.fixture
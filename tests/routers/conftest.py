@@ -33,6 +33,7 @@ def _mock_backend(
     from pydantic import ConfigDict
 
     from dataspaces_entities.backend.backend import (
+        Backend,
         BackendError,
         BackendSettings,
         BackendWriteAccessError,
@@ -83,9 +84,7 @@ def _mock_backend(
         def initialize(self) -> None:
             pass
 
-        def create(
-            self, entities: Iterable[SOFT7Entity | dict[str, Any]]
-        ) -> list[dict[str, Any]] | dict[str, Any] | None:
+        def create(self, entities: Iterable[SOFT7Entity | dict[str, Any]]) -> list[dict[str, Any]]:
             """Create entities.
 
             For testing purposes:
@@ -110,16 +109,10 @@ def _mock_backend(
                     f"Valid entities: {valid_prepared_entities}"
                 )
 
-            if not entities:
-                return None
-
             self.__test_data.extend(entities)
             self.__test_data_uris.extend(entity_identities)
 
-            if len(entities) > 1:
-                return entities
-
-            return entities[0]
+            return entities
 
         def read(self, entity_identity: AnyHttpUrl | str) -> dict[str, Any] | None:
             if entity_identity in self.__test_data_uris:
@@ -142,6 +135,9 @@ def _mock_backend(
 
             return
 
+        # Use the backend-agnostic default, which calls `update()` for each entity
+        update_many = Backend.update_many
+
         def delete(self, entity_identities: Iterable[AnyHttpUrl | str]) -> None:
             if any(URI_REGEX.match(str(identity)) is None for identity in entity_identities):
                 raise MockBackendError("One or more invalid entity identities given.")
@@ -151,6 +147,14 @@ def _mock_backend(
                     self.__test_data.pop(self.__test_data_uris.index(identity))
                     self.__test_data_uris.remove(identity)
 
+        def has_identity(self, entity_identity: AnyHttpUrl | str) -> bool:
+            return str(entity_identity) in self.__test_data_uris
+
+        def exists_many(self, entity_identities: Iterable[AnyHttpUrl | str]) -> set[str]:
+            return {
+                str(identity) for identity in entity_identities if str(identity) in self.__test_data_uris
+            }
+
         def search(
             self,
             raw_query: Any = None,
@@ -196,7 +200,8 @@ def _mock_backend(
                         raise MockBackendError("Invalid entity dimensions.")
 
             if by_identity:
-                for identity in by_identity:
+                # Each entity is only returned once, like with MongoDB's `$in` operator
+                for identity in dict.fromkeys(by_identity):
                     if identity in self.__test_data_uris:
                         results.append(self._test_data[self.__test_data_uris.index(identity)])
 
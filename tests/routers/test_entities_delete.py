@@ -0,0 +1,76 @@
+"""Test the service's /entities router with `DELETE` endpoints."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ..conftest import ClientFixture
+
+
+pytestmark = [
+    pytest.mark.usefixtures("_mock_openid_url_request"),
+    pytest.mark.httpx_mock(assert_all_responses_were_requested=False),
+]
+
+
+ENDPOINT = "/entities"
+
+
+def test_delete_entities(backend_test_data: list[dict[str, Any]], client: ClientFixture) -> None:
+    """Test deleting several entities given in both the body and the query.
+
+    The deleted identities should be returned once each, in the order they were requested.
+    """
+    import json
+
+    from dataspaces_entities.utils import get_identity
+
+    first, second, third = (get_identity(entity) for entity in backend_test_data[:3])
+
+    with client(allowed_role="entities:delete") as client_:
+        response = client_.request(
+            "DELETE", ENDPOINT, json=[second, first, second], params={"id": [first, third]}
+        )
+
+        try:
+            response_json = response.json()
+        except json.JSONDecodeError:
+            pytest.fail(f"Failed to decode response: {response.content!r}")
+
+        # Check response
+        assert response.status_code == 200, json.dumps(response_json, indent=2)
+        assert response_json == [second, first, third], json.dumps(response_json, indent=2)
+
+        # Check the entities have been deleted
+        response = client_.get(ENDPOINT, params={"id": [first, second, third]})
+        assert response.status_code == 404, response.content
+
+
+def test_delete_single_entity(backend_test_data: list[dict[str, Any]], client: ClientFixture) -> None:
+    """Test deleting a single entity given as a string in the body."""
+    import json
+
+    from dataspaces_entities.utils import get_identity
+
+    identity = get_identity(backend_test_data[0])
+
+    with client(allowed_role="entities:delete") as client_:
+        response = client_.request("DELETE", ENDPOINT, json=identity)
+
+        try:
+            response_json = response.json()
+        except json.JSONDecodeError:
+            pytest.fail(f"Failed to decode response: {response.content!r}")
+
+        # Check response
+        assert response.status_code == 200, json.dumps(response_json, indent=2)
+        assert response_json == identity, json.dumps(response_json, indent=2)
+
+        # Check the entity has been deleted
+        response = client_.get(ENDPOINT, params={"id": [identity]})
+        assert response.status_code == 404, response.content
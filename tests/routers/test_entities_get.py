@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 import pytest
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from ..conftest import ClientFixture, ParameterizeGetEntities
 
 pytestmark = [
@@ -73,6 +75,58 @@ def test_get_entity_instance(
     Instance.from_dict(resolved_entity)
 
 
+def test_get_entities(backend_test_data: list[dict[str, Any]], client: ClientFixture) -> None:
+    """Test the route to retrieve several entities, which are streamed as a JSON list."""
+    import json
+
+    from fastapi import status
+
+    from dataspaces_entities.utils import get_identity
+
+    identities = [get_identity(entity) for entity in backend_test_data]
+
+    with client() as client_:
+        response = client_.get(ENDPOINT, params={"id": identities}, timeout=5)
+
+    try:
+        resolved_entities = response.json()
+    except json.JSONDecodeError:
+        pytest.fail(f"Response not JSON: {response.text}")
+
+    assert response.status_code == status.HTTP_200_OK, json.dumps(resolved_entities, indent=2)
+    assert response.headers["content-type"] == "application/json"
+
+    assert isinstance(resolved_entities, list), json.dumps(resolved_entities, indent=2)
+    assert sorted(resolved_entities, key=get_identity) == sorted(backend_test_data, key=get_identity)
+
+
+def test_get_entities_duplicate_identities(
+    backend_test_data: list[dict[str, Any]], client: ClientFixture
+) -> None:
+    """Test that each entity is only retrieved once, when its identity is requested multiple times."""
+    import json
+
+    from fastapi import status
+
+    from dataspaces_entities.utils import get_identity
+
+    identities = [get_identity(entity) for entity in backend_test_data]
+
+    with client() as client_:
+        response = client_.get(ENDPOINT, params={"id": identities[::-1] + identities}, timeout=5)
+
+    try:
+        resolved_entities = response.json()
+    except json.JSONDecodeError:
+        pytest.fail(f"Response not JSON: {response.text}")
+
+    assert response.status_code == status.HTTP_200_OK, json.dumps(resolved_entities, indent=2)
+
+    assert isinstance(resolved_entities, list), json.dumps(resolved_entities, indent=2)
+    assert len(resolved_entities) == len(backend_test_data), json.dumps(resolved_entities, indent=2)
+    assert sorted(resolved_entities, key=get_identity) == sorted(backend_test_data, key=get_identity)
+
+
 def test_get_entity_not_found(client: ClientFixture) -> None:
     """Test that the route returns a Not Found (404) for non existent identities."""
     import json
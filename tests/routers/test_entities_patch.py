@@ -0,0 +1,74 @@
+"""Test the service's /entities router with `PATCH` endpoints."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+    from ..conftest import ClientFixture
+
+
+pytestmark = [
+    pytest.mark.usefixtures("_mock_openid_url_request"),
+    pytest.mark.httpx_mock(assert_all_responses_were_requested=False),
+]
+
+
+ENDPOINT = "/entities"
+
+
+def test_patch_existing_entity(static_dir: Path, client: ClientFixture) -> None:
+    """Test updating an existing entity."""
+    import yaml
+
+    from dataspaces_entities.utils import get_identity
+
+    # Load entities
+    entity: dict[str, Any] = yaml.safe_load((static_dir / "valid_entities.yaml").read_text())[1]
+    scrubbed_entity: dict[str, Any] = yaml.safe_load(
+        (static_dir / "valid_entities_soft7.yaml").read_text()
+    )[1]
+
+    # Change the description of the entity
+    for entity_ in (entity, scrubbed_entity):
+        entity_["description"] = f"Updated: {entity_['description']}"
+
+    with client(allowed_role="entities:edit") as client_:
+        response = client_.patch(ENDPOINT, json=entity)
+
+        # Check response
+        assert response.status_code == 204, response.content
+        assert response.content == b"", response.content
+
+        # Check the entity has been updated
+        response = client_.get(ENDPOINT, params={"id": [get_identity(scrubbed_entity)]})
+        assert response.status_code == 200, response.content
+        assert response.json() == scrubbed_entity, response.content
+
+
+def test_patch_non_existent_entity(client: ClientFixture) -> None:
+    """Test that a 502 exception is raised when updating an entity that does not exist."""
+    import json
+
+    identity = "http://onto-ns.com/meta/1.0/NonExistentEntity"
+    expected_detail = f"Could not patch/update entity with identity: {identity}"
+
+    with client(raise_server_exceptions=False, allowed_role="entities:edit") as client_:
+        response = client_.patch(
+            ENDPOINT, json={"uri": identity, "description": "An entity not in the backend."}
+        )
+
+    try:
+        response_json = response.json()
+    except json.JSONDecodeError:
+        pytest.fail(f"Failed to decode response: {response.content!r}")
+
+    # Check response
+    assert response.status_code == 502, json.dumps(response_json, indent=2)
+    assert "detail" in response_json, json.dumps(response_json, indent=2)
+    assert response_json["detail"] == expected_detail, json.dumps(response_json, indent=2)
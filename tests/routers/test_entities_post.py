@@ -135,6 +135,41 @@ def test_create_invalid_entity(
         assert "detail" in response_json, f"{error_message}\n{json.dumps(response_json, indent=2)}"
 
 
+@pytest.mark.parametrize(
+    ("method", "role"),
+    [("POST", "entities:write"), ("PUT", "entities:edit")],
+    ids=["POST", "PUT"],
+)
+@pytest.mark.parametrize(
+    "body",
+    [b'"/etc/passwd"', b'["/etc/passwd", "http://localhost:7000/entity"]', b'{"identity": '],
+    ids=["string", "list-of-strings", "malformed-json"],
+)
+def test_invalid_json_body(client: ClientFixture, method: str, role: str, body: bytes) -> None:
+    """Test creating/replacing entities from a JSON body that is not an object or a list of objects.
+
+    Strings must never be resolved as entity file paths or URLs.
+    """
+    import json
+
+    with client(raise_server_exceptions=False, allowed_role=role) as client_:
+        response = client_.request(
+            method, ENDPOINT, content=body, headers={"Content-Type": "application/json"}
+        )
+
+    try:
+        response_json = response.json()
+    except json.JSONDecodeError:
+        pytest.fail(f"Failed to decode response: {response.content!r}")
+
+    # Check response
+    assert response.status_code == 422, json.dumps(response_json, indent=2)
+    assert isinstance(response_json, dict), json.dumps(response_json, indent=2)
+    assert response_json == {"detail": "Invalid entities provided. Cannot parse request."}, json.dumps(
+        response_json, indent=2
+    )
+
+
 @pytest.mark.skip_if_live_backend("Authentication is disabled in the live backend.")
 def test_user_with_no_write_access(
     static_dir: Path,
@@ -236,7 +271,7 @@ def test_backend_create_returns_bad_value(
     monkeypatch.setattr(
         entities_backend.MongoDBBackend,
         "create",
-        lambda *args, **kwargs: None,  # noqa: ARG005
+        lambda *args, **kwargs: [],  # noqa: ARG005
     )
 
     # Create single entity
@@ -0,0 +1,97 @@
+"""Test the service's /entities router with `PUT` endpoints."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+    from ..conftest import ClientFixture
+
+
+pytestmark = [
+    pytest.mark.usefixtures("_mock_openid_url_request"),
+    pytest.mark.httpx_mock(assert_all_responses_were_requested=False),
+]
+
+
+ENDPOINT = "/entities"
+
+
+def test_update_new_and_existing_entities(static_dir: Path, client: ClientFixture) -> None:
+    """Test replacing a mix of new and existing entities.
+
+    Only the created (new) entities should be returned.
+    """
+    import json
+
+    import yaml
+
+    from dataspaces_entities.utils import get_identity
+
+    # Load entities
+    entities: list[dict[str, Any]] = yaml.safe_load((static_dir / "valid_entities.yaml").read_text())
+    scrubbed_entities: list[dict[str, Any]] = yaml.safe_load(
+        (static_dir / "valid_entities_soft7.yaml").read_text()
+    )
+    new_entity, existing_entity = entities[:2]
+    new_identity = get_identity(scrubbed_entities[0])
+
+    with client(allowed_role="entities:delete") as client_:
+        # Remove the first entity from the backend, making it new
+        response = client_.delete(ENDPOINT, params={"id": [new_identity]})
+        assert response.status_code == 200, response.content
+
+        response = client_.put(ENDPOINT, json=[new_entity, existing_entity])
+
+        try:
+            response_json = response.json()
+        except json.JSONDecodeError:
+            pytest.fail(f"Failed to decode response: {response.content!r}")
+
+        # Check response
+        assert response.status_code == 201, json.dumps(response_json, indent=2)
+        assert isinstance(response_json, dict), json.dumps(response_json, indent=2)
+        assert response_json == scrubbed_entities[0], json.dumps(response_json, indent=2)
+
+        # Check the new entity has been created
+        response = client_.get(ENDPOINT, params={"id": [new_identity]})
+        assert response.status_code == 200, response.content
+        assert response.json() == scrubbed_entities[0], response.content
+
+
+def test_update_existing_entities(static_dir: Path, client: ClientFixture) -> None:
+    """Test replacing only existing entities.
+
+    Nothing is created, so the response should be a body-less 204.
+    """
+    import yaml
+
+    from dataspaces_entities.utils import get_identity
+
+    # Load entities
+    entities: list[dict[str, Any]] = yaml.safe_load((static_dir / "valid_entities.yaml").read_text())
+    scrubbed_entities: list[dict[str, Any]] = yaml.safe_load(
+        (static_dir / "valid_entities_soft7.yaml").read_text()
+    )
+
+    # Change the description of the first two entities
+    for entity in entities[:2] + scrubbed_entities[:2]:
+        entity["description"] = f"Updated: {entity['description']}"
+
+    with client(allowed_role="entities:edit") as client_:
+        response = client_.put(ENDPOINT, json=entities[:2])
+
+        # Check response
+        assert response.status_code == 204, response.content
+        assert response.content == b"", response.content
+
+        # Check the entities have been updated
+        for scrubbed_entity in scrubbed_entities[:2]:
+            response = client_.get(ENDPOINT, params={"id": [get_identity(scrubbed_entity)]})
+            assert response.status_code == 200, response.content
+            assert response.json() == scrubbed_entity, response.content
@@ -0,0 +1,18 @@
+"""Test the service configuration."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def test_mongo_min_pool_size_exceeds_max() -> None:
+    """Test a minimum MongoDB connection pool size larger than the maximum is invalid."""
+    from pydantic import ValidationError
+
+    from dataspaces_entities.config import ServiceConfig
+
+    with pytest.raises(ValidationError, match=r"mongo_min_pool_size \(5\) must be smaller than"):
+        ServiceConfig(mongo_min_pool_size=5, mongo_max_pool_size=2)
+
+    # A maximum pool size of 0 means no limit
+    assert ServiceConfig(mongo_min_pool_size=5, mongo_max_pool_size=0).mongo_min_pool_size == 5